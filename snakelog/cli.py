@@ -7,19 +7,23 @@ workflow and provides methods for viewing logs and lock status. It also defines
 several utility functions for parsing Snakemake logs.
 """
 
+import io
+import os
 import re
 import sys
+import mmap
 import glob
 import pydoc
 import logging
-import itertools
 import subprocess
 from enum import Enum
 from pathlib import Path
+from datetime import datetime
 from shutil import which
-from dateutil import parser
+from functools import cached_property
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from collections import defaultdict
+from collections import Counter, defaultdict
 
 import fire
 import tabulate
@@ -51,6 +55,35 @@ ERROR_LABELS = [
 
 SUCCESS_LABELS = ["(100%) done"]
 
+# e.g. 2023-08-23T230733.352042.snakemake.log; isoformat() drops the
+# fractional part when microseconds are 0, e.g. 2023-08-24T101010.snakemake.log
+LOG_SUFFIX = ".snakemake.log"
+LOG_NAME_FORMAT = "%Y-%m-%dT%H%M%S.%f"
+LOG_NAME_SECONDS_FORMAT = "%Y-%m-%dT%H%M%S"
+# e.g. [Wed Aug 23 23:07:35 2023], as written by time.asctime()
+LOG_TIMESTAMP_FORMAT = "%a %b %d %H:%M:%S %Y"
+
+DIGITS_RE = re.compile(r"\d+")
+# e.g. 402 of 402 steps (100%) done
+STEPS_DONE_RE = re.compile(rb"(\d+) of (\d+) steps \(100%\) done")
+
+# ANSI escape codes used when printing tables
+BOLD, RED, GREEN, YELLOW, RESET = "\33[1m", "\33[31m", "\33[32m", "\33[33m", "\33[0m"
+
+HISTORY_ROW = (
+    "{timestamp:<20}|{color}{uuid:<10}|{num_jobs:<10}|{queued:<10}|{failed:<10}|{finished:<10}"
+    + RESET
+)
+HISTORY_ERROR_ROW = "{timestamp:<20}|" + RED + "{uuid:<10}|{msg:<10}" + RESET
+
+# Bytes from the end of a log scanned for the final progress line
+TAIL_BYTES = 4096
+# Read buffer for parsing whole logs
+READ_BUFFER_SIZE = 256 * 1024
+
+# dataclass(slots=True) is only available on Python 3.10+
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class SnakemakeStatus(Enum):
     SUCCESS = 0
@@ -59,73 +92,119 @@ class SnakemakeStatus(Enum):
     CATCHALL_ERROR = -1
 
 
-def parse_rule_grammar(line, job_dict):
-    # print(f"line>>>>{line}")
-    if line.startswith("rule") or line.startswith("localrule"):
-        return {"rule": line.strip(":").split()[1]}
-    elif line.startswith("Error in"):
+def _parse_rule(line):
+    return {"rule": line.strip(":").split()[1]}
+
+
+def _parse_error(line):
+    if line.startswith("Error in"):
         return {"rule": line.strip(":").split()[-1], "status": "failed"}
-    elif line.startswith("cluster_jobid"):
-        return {"external_jobid": re.findall(r"\d+", line)[0]}
-    elif line.startswith("Finished"):
-        return {"status": "finished", "jobid": line.strip(".").split()[-1]}
-    elif line.startswith("input"):
-        return {"input": [x.strip() for x in line.split(":")[1].split(",")]}
-    elif line.startswith("output"):
-        return {"output": [x.strip() for x in line.split(":")[1].split(",")]}
-    elif line.startswith("Error"):
-        return {"status": "failed"}
-    elif line.startswith("params"):
-        return {
-            "params": {
-                k: v
-                for k, v in [
-                    x.strip().split("=") for x in line.split(":")[1].split(",")
-                ]
-            }
-        }
-    elif line.startswith("wildcards"):
-        return {
-            "wildcards": {
-                k: v
-                for k, v in [
-                    x.strip().split("=") for x in line.split(":")[1].split(",")
-                ]
-            }
-        }
-    elif line.startswith("resources"):
-        return {
-            "resources": {
-                k: v
-                for k, v in [
-                    x.strip().split("=") for x in line.split(":")[1].split(",")
-                ]
-            }
-        }
-    elif line.startswith("jobid"):
-        return {"jobid": int(line.split(":")[1].strip())}
-    elif line.startswith("log"):
-        return {"log": line.split(":")[1].strip()}
-    elif line.startswith("threads"):
-        return {"threads": int(line.split(":")[1].strip())}
-    elif line.startswith("Submitted"):
-        external_jobid = re.findall(r"\d+", line)
-        if external_jobid:
-            external_jobid = external_jobid[1]
-        return {"external_jobid": external_jobid, "status": "submitted"}
-    elif any([line.startswith(x) for x in ERROR_LABELS]) and job_dict.get("status", None) != "finished":
+    return {"status": "failed"}
+
+
+def _parse_list(line):
+    return [x.strip() for x in line.split(":", 1)[1].split(",")]
+
+
+def _parse_key_values(line):
+    return {
+        k: v for k, _, v in (x.strip().partition("=") for x in line.split(":", 1)[1].split(","))
+    }
+
+
+def _parse_submitted(line):
+    external_jobid = DIGITS_RE.findall(line)
+    if external_jobid:
+        external_jobid = external_jobid[1]
+    return {"external_jobid": external_jobid, "status": "submitted"}
+
+
+# Keyed on the first word of a (stripped) log line, without trailing colon
+RULE_GRAMMAR = {
+    "rule": _parse_rule,
+    "localrule": _parse_rule,
+    "Error": _parse_error,
+    "cluster_jobid": lambda line: {"external_jobid": DIGITS_RE.findall(line)[0]},
+    "Finished": lambda line: {"status": "finished", "jobid": line.strip(".").split()[-1]},
+    "input": lambda line: {"input": _parse_list(line)},
+    "output": lambda line: {"output": _parse_list(line)},
+    "params": lambda line: {"params": _parse_key_values(line)},
+    "wildcards": lambda line: {"wildcards": _parse_key_values(line)},
+    "resources": lambda line: {"resources": _parse_key_values(line)},
+    "jobid": lambda line: {"jobid": int(line.split(":", 1)[1].strip())},
+    "log": lambda line: {"log": line.split(":", 1)[1].strip()},
+    "threads": lambda line: {"threads": int(line.split(":", 1)[1].strip())},
+    "Submitted": _parse_submitted,
+}
+
+ERROR_PREFIXES = tuple(ERROR_LABELS)
+# Cheap first-character check before testing every error prefix
+ERROR_FIRST_CHARS = frozenset(x[0] for x in ERROR_LABELS if x)
+
+# Lines without a colon only carry information if they start with one of these
+KEYWORD_PREFIXES = ("rule", "localrule", "Error", "Finished", "Submitted", *ERROR_PREFIXES)
+
+
+def parse_rule_grammar(line, job_dict):
+    handler = RULE_GRAMMAR.get(line.partition(" ")[0].rstrip(":"))
+    if handler is not None:
+        return handler(line)
+    elif (
+        line[:1] in ERROR_FIRST_CHARS
+        and line.startswith(ERROR_PREFIXES)
+        and job_dict.get("status", None) != "finished"
+    ):
         return {"status": "failed"}
     else:
         return {"kwargs": line.strip()}
 
 
+def parse_log_tail(log):
+    """Return the number of jobs if the log ends with a completed run, else None.
+
+    Only the last TAIL_BYTES of the file are scanned, so completed runs can be
+    summarised without parsing every job block.
+    """
+    size = os.stat(log).st_size
+    if size == 0:
+        return None
+
+    with open(log, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        pos = mm.rfind(b" steps (", max(0, size - TAIL_BYTES))
+        if pos == -1:
+            return None
+        match = STEPS_DONE_RE.match(mm, mm.rfind(b"\n", 0, pos) + 1)
+        if match is None:
+            return None
+        done, total = int(match[1]), int(match[2])
+
+    # "(100%)" is rounded, so make sure every step actually finished
+    return total if done == total else None
+
+
+def parse_log_name(name):
+    "Parse the timestamp of a log name with its .snakemake.log suffix removed"
+    if "." in name:
+        return datetime.strptime(name, LOG_NAME_FORMAT)
+    return datetime.strptime(name, LOG_NAME_SECONDS_FORMAT)
+
+
+def read_log_lines(log):
+    "Read a log through a large binary buffer and return its decoded lines"
+    # TextIOWrapper splits on newlines only and translates \r\n, like text mode
+    with io.TextIOWrapper(
+        open(log, "rb", buffering=READ_BUFFER_SIZE), encoding="utf-8", errors="replace"
+    ) as f:
+        return f.readlines()
+
+
 def page_log(logfile):
     if which("bat") is not None:
         pydoc.pager = lambda x: pydoc.pipepager(x, "bat --style=plain --language log")
     return pydoc.pager(logfile)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Job:
     timestamp: str = None
     rule: str = None
@@ -149,7 +228,7 @@ class Job:
         return self.__str__()
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class JobStats:
     name: str = None
     count: int = None
@@ -163,6 +242,51 @@ class JobStats:
         return self.__str__()
 
 
+class JobTable(object):
+    """Jobs parsed from a log, stored column-wise and keyed by jobid.
+
+    Only the columns needed for summaries are kept; full per-job dicts are
+    built only when requested with details=True.
+    """
+
+    def __init__(self, details: bool = False):
+        self.index = {}  # jobid -> row, in order of first appearance
+        self.timestamps = []
+        self.rules = []
+        self.statuses = []
+        self.external_jobids = []
+        self.details = [] if details else None
+
+    def __len__(self):
+        return len(self.index)
+
+    def __contains__(self, jobid):
+        return jobid in self.index
+
+    def update(self, job_dict):
+        jobid = int(job_dict["jobid"])
+        row = self.index.get(jobid)
+        if row is None:
+            row = self.index[jobid] = len(self.rules)
+            self.timestamps.append(None)
+            self.rules.append(None)
+            self.statuses.append(None)
+            self.external_jobids.append(None)
+            if self.details is not None:
+                self.details.append({})
+
+        if "timestamp" in job_dict:
+            self.timestamps[row] = job_dict["timestamp"]
+        if "rule" in job_dict:
+            self.rules[row] = job_dict["rule"]
+        if "status" in job_dict:
+            self.statuses[row] = job_dict["status"]
+        if "external_jobid" in job_dict:
+            self.external_jobids[row] = job_dict["external_jobid"]
+        if self.details is not None:
+            self.details[row].update(job_dict)
+
+
 class SnakeObject(object):
     def __init__(self, path: str = "."):
         self.path = Path(path) / ".snakemake"
@@ -174,13 +298,20 @@ class SnakeObject(object):
             )
             sys.exit(1)
 
-    @property
+    @cached_property
+    def _log_cache(self):
+        "(timestamp, path, uuid) of each log, most recent first; globbed and parsed once"
+        logs = []
+        for x in glob.glob(str(self.log_dir / "*.log")):
+            # <timestamp>[.<uuid>].snakemake.log
+            name = os.path.basename(x)[: -len(LOG_SUFFIX)]
+            uuid = name.partition(".")[2]
+            logs.append((parse_log_name(name), x, uuid))
+        return sorted(logs, key=lambda x: x[0], reverse=True)
+
+    @cached_property
     def __logs(self):
-        return sorted(
-            glob.glob(str(self.log_dir / "*.log")),
-            key=lambda x: parser.parse(Path(x).stem.replace(".snakemake", "")),
-            reverse=True,
-        )
+        return [log for _, log, _ in self._log_cache]
 
     @property
     def _locked(self):
@@ -190,9 +321,10 @@ class SnakeObject(object):
 
     def logs(self, n: int = 10):
         "Print the path of last n logs"
-        for i, log in enumerate(self.__logs):
+        logs = self.__logs
+        for i, log in enumerate(logs):
             if i > (n - 1):
-                print(f"... {len(self.__logs) - n} more logs")
+                print(f"... {len(logs) - n} more logs")
                 break
             print(f"{i+1}\t{log}")
 
@@ -208,19 +340,17 @@ class SnakeObject(object):
         "Dry-run Snakemake"
         try:
             sys.stderr.writelines(f"Dry-run mode\n------------\n")
-            _snakefile = f"--snakefile {snakefile}" if snakefile else ""
-            subprocess.run(f"snakemake -npr {_snakefile}", shell=True, check=True)
+            _snakefile = ["--snakefile", str(snakefile)] if snakefile else []
+            subprocess.run(["snakemake", "-npr", *_snakefile], check=True)
         except:
             sys.stderr.write("Error: Snakemake dry-run failed.\n")
 
     def unlock(self, snakefile=None):
         "Unlock the Snakemake directory"
         if self._locked:
-            _snakefile = f"--snakefile {snakefile}" if snakefile else ""
+            _snakefile = ["--snakefile", str(snakefile)] if snakefile else []
             try:
-                subprocess.run(
-                    f"snakemake --unlock {_snakefile}", shell=True, check=True
-                )
+                subprocess.run(["snakemake", "--unlock", *_snakefile], check=True)
             except subprocess.CalledProcessError:
                 return
         else:
@@ -240,41 +370,45 @@ class SnakeObject(object):
         "Show a log file contents"
         self.show(n)
 
-    def _stats(self, log):
-        stats_ = {}
-        for line in list(
-            itertools.takewhile(
-                lambda x: "Select jobs" not in x,
-                itertools.dropwhile(lambda x: "---" not in x, open(log)),
-            )
-        ):
-            if line.startswith("---") or line.strip() == "":
+    def _stats(self, lines):
+        stats_, started = {}, False
+        for line in lines:
+            if "Select jobs" in line:
+                break
+            if not started:
+                started = "---" in line
+                continue
+            line = line.strip()
+            if not line or line.startswith("---"):
                 continue
-            _line = line.split()
-            stats_[_line[0]] = JobStats(*_line)
+            name, *counts = line.split()
+            # Only table rows; error messages can follow a '---' line too
+            if counts and all(x.isdigit() for x in counts):
+                stats_[name] = JobStats(name, *map(int, counts))
 
         return stats_
 
-    def __parse_jobs_in_log(self, log):
-        """Parse the log file and return a list of job dicts."""
-        f = open(log, "r")
-        err, msg, jobs, begin = None, "", defaultdict(dict), next(f)
+    def __parse_jobs_in_log(self, lines, details: bool = False):
+        """Parse the lines of a log file and return a JobTable of its jobs."""
+        f = iter(lines)
+        err, msg, jobs, begin = None, "", JobTable(details), next(f, None)
         while line := begin:
             job_dict = dict()
             if line.startswith("[") and not "error" in line:
-                timestamp = parser.parse(line.strip("[]\n"))
+                timestamp = datetime.strptime(line.strip("[]\n"), LOG_TIMESTAMP_FORMAT)
                 job_dict.update({"timestamp": timestamp})
 
                 while (_line := next(f, None)) and not _line.startswith("["):
-                    if not _line.strip():
+                    stripped = _line.strip()
+                    if ":" not in stripped and not stripped.startswith(KEYWORD_PREFIXES):
                         continue
-                    job_dict.update(parse_rule_grammar(_line.strip(), job_dict))
+                    job_dict.update(parse_rule_grammar(stripped, job_dict))
 
                 if line.startswith("["):
                     begin = _line
 
-                jobs[int(job_dict["jobid"])].update(**job_dict)
-            elif any([line.startswith(x) for x in ERROR_LABELS]):
+                jobs.update(job_dict)
+            elif line[:1] in ERROR_FIRST_CHARS and line.startswith(ERROR_PREFIXES):
                 err, msg = SnakemakeStatus.ERROR, "Snakemake exited with an error"
                 break
             elif line.startswith("Unlocking"):
@@ -286,33 +420,47 @@ class SnakeObject(object):
             else:
                 begin = next(f, None)
 
-        f.close()
-
         return err, msg, jobs
 
-    def _execution_summary(self, n: int = 0):
-        # 0-based
+    def _execution_summary(self, lines):
         summary_dict = defaultdict(dict)
-        err, msg, jobs = self.__parse_jobs_in_log(self.__logs[n])
+        err, msg, jobs = self.__parse_jobs_in_log(lines)
 
         if jobs is None:
             return err, msg, None
 
-        for v in jobs.values():
-            summary_dict[v["rule"]]["number_of_jobs"] = (
-                summary_dict[v["rule"]].get("number_of_jobs", 0) + 1
-            )
-            if "status" in v:
-                summary_dict[v["rule"]][v["status"]] = (
-                    summary_dict[v["rule"]].get(v["status"], 0) + 1
-                )
+        for rule, count in Counter(jobs.rules).items():
+            summary_dict[rule]["number_of_jobs"] = count
+        for (rule, status), count in Counter(zip(jobs.rules, jobs.statuses)).items():
+            if status is not None:
+                summary_dict[rule][status] = count
 
         return err, msg, summary_dict
 
+    def _execution_totals(self, log):
+        # returns msg and (num_jobs, queued, failed, finished) or None
+        num_jobs = parse_log_tail(log)
+        if num_jobs is not None:
+            return "", (num_jobs, 0, 0, num_jobs)
+
+        _, msg, summary_dict = self._execution_summary(read_log_lines(log))
+        if not summary_dict:
+            return msg, None
+
+        num_jobs, queued, failed, finished = 0, 0, 0, 0
+        for v in summary_dict.values():
+            num_jobs += v.get("number_of_jobs", 0)
+            finished += v.get("finished", 0)
+            queued += v.get("submitted", 0)
+            failed += v.get("failed", 0)
+
+        return msg, (num_jobs, queued, failed, finished)
+
     def history(self, n: int = 10, skip_error: bool = False):
         "View Snakemake execution history with job stats"
         assert n > 0, "-n must be greater than 0"
-        n = min(n, len(self.__logs))
+        logs = self._log_cache
+        n = min(n, len(logs))
 
         print(
             f"{'timestamp':<20}|{'uuid':<10}|{'num_jobs':<10}|{'queued':<10}|{'failed':<10}|{'finished':<10}"
@@ -320,51 +468,46 @@ class SnakeObject(object):
         print(
             f"{'---------':<20}|{'----':<10}|{'--------':<10}|{'------':<10}|{'------':<10}|{'--------':<10}"
         )
-        for i, log in enumerate(self.__logs):
-            if i > (n - 1):
-                print("... {} more logs".format(len(self.__logs) - n))
-                break
+        # Logs are independent and mostly I/O bound; parse them in threads and
+        # print in order afterwards
+        with ThreadPoolExecutor(max_workers=max(1, min(n, os.cpu_count() or 1))) as pool:
+            results = pool.map(self._execution_totals, [log for _, log, _ in logs[:n]])
 
-            timestamp, uuid, _ = Path(log).stem.split(".")
-            _, msg, summary_dict = self._execution_summary(i)  # 0-based
+        for (timestamp, _, uuid), (msg, totals) in zip(logs[:n], results):
+            row = {"timestamp": timestamp.strftime("%I:%M:%S %p, %b %d"), "uuid": uuid}
 
-            if not summary_dict:
+            if totals is None:
                 if not skip_error:
-                    print(
-                        f"{parser.parse(timestamp).strftime('%I:%M:%S %p, %b %d'):<20}|\33[31m{uuid:<10}|{msg:<10}\33[0m"
-                    )
+                    print(HISTORY_ERROR_ROW.format_map(dict(row, msg=msg)))
                 continue
 
-            num_jobs, finished, queued, failed, finished = 0, 0, 0, 0, 0
-            for _, v in summary_dict.items():
-                num_jobs += v.get("number_of_jobs", 0)
-                finished += v.get("finished", 0)
-                queued += v.get("submitted", 0)
-                failed += v.get("failed", 0)
-
-            if finished == num_jobs:
-                print(
-                    f"{parser.parse(timestamp).strftime('%I:%M:%S %p, %b %d'):<20}|\33[32m{uuid:<10}|{num_jobs:<10}|{queued:<10}|{failed:<10}|{finished:<10}\33[0m"
-                )
-            else:
-                print(
-                    f"{parser.parse(timestamp).strftime('%I:%M:%S %p, %b %d'):<20}|\33[33m{uuid:<10}|{num_jobs:<10}|{queued:<10}|{failed:<10}|{finished:<10}\33[0m"
-                )
+            num_jobs, queued, failed, finished = totals
+            row.update(num_jobs=num_jobs, queued=queued, failed=failed, finished=finished)
+            row["color"] = GREEN if finished == num_jobs else YELLOW
+            print(HISTORY_ROW.format_map(row))
+
+        if len(logs) > n:
+            print("... {} more logs".format(len(logs) - n))
 
     def status(self, n: int = 1):
         "Get log path and print summary of log file"
         assert n > 0, "-n must be greater than 0"
-        n = len(self.__logs) if n > len(self.__logs) else n
+        logs = self.__logs
+        n = len(logs) if n > len(logs) else n
+        log = logs[n - 1]  # 0-based
 
-        err, msg, summary_dict = self._execution_summary(n - 1)  # 0-based
-        stats = self._stats(self.__logs[n - 1])  # 0-based
+        # Read the log once for both the job records and the job stats table
+        lines = read_log_lines(log)
+        err, msg, summary_dict = self._execution_summary(lines)
 
-        print(f"Summary of log file: {self.__logs[n-1]}\n")
+        print(f"Summary of log file: {log}\n")
 
         if not summary_dict:
             print(f"{msg}. No jobs to display")
             sys.exit(0)
 
+        stats = self._stats(lines)
+
         # Print rule summaries; remember that one rule may have multiple jobs
         pp_table = []
         total_finished_so_far, total_failed_so_far = 0, 0
@@ -375,29 +518,26 @@ class SnakeObject(object):
             total_finished_so_far += stats_so_far.get("finished", 0)
             total_failed_so_far += stats_so_far.get("failed", 0)
             pp_table.append(
-                [f"\33[1m{job.strip(':')}", f"{str(v.count)}\33[0m", f"\33[33m{str(stats_so_far.get('submitted', 0))}\33[0m", f"\33[31m{str(stats_so_far.get('failed', 0))}\33[0m", f"\33[32m{str(stats_so_far.get('finished', 0))}\33[0m"]
+                [f"{BOLD}{job.strip(':')}", f"{v.count}{RESET}", f"{YELLOW}{stats_so_far.get('submitted', 0)}{RESET}", f"{RED}{stats_so_far.get('failed', 0)}{RESET}", f"{GREEN}{stats_so_far.get('finished', 0)}{RESET}"]
             )
 
         print(tabulate.tabulate(pp_table, headers=["rule", "number_of_jobs", "queued", "failed", "finished"]))
 
         # Print cute summary after showing job stats
-        if total_finished_so_far < int(stats.get("total", JobStats).count):
-            phrase, color_begin, color_end = "Only finished", "\33[33m", "\33[0m"
+        total = stats.get("total", JobStats()).count
+        if total_finished_so_far < total:
+            phrase, color_begin, color_end = "Only finished", YELLOW, RESET
         else:
             phrase, color_begin, color_end = (
                 "Successfully finished",
-                "\33[32m",
-                "\33[0m",
+                GREEN,
+                RESET,
             )
 
-        pct_failed = int(
-            (total_failed_so_far / int(stats.get("total", JobStats).count)) * 100
-        )
-        pct_finished = int(
-            (total_finished_so_far / int(stats.get("total", JobStats).count)) * 100
-        )
+        pct_failed = int((total_failed_so_far / total) * 100)
+        pct_finished = int((total_finished_so_far / total) * 100)
         print(
-            f"\n{phrase} {color_begin}{total_finished_so_far} ({pct_finished}%){color_end} and failed \33[31m{total_failed_so_far} ({pct_failed}%)\33[0m of total {stats.get('total', JobStats).count} planned jobs."
+            f"\n{phrase} {color_begin}{total_finished_so_far} ({pct_finished}%){color_end} and failed {RED}{total_failed_so_far} ({pct_failed}%){RESET} of total {total} planned jobs."
         )
         if self._locked and n == 1:
             print("FYI - lock files are present, Snakemake may be running!")
@@ -408,30 +548,30 @@ class SnakeObject(object):
 
     def jobs(self, n: int = 1):
         "Print job summary for n-th most recent execution; detailed status"
-        err, msg, jobs = self.__parse_jobs_in_log(self.__logs[n - 1])
+        err, msg, jobs = self.__parse_jobs_in_log(read_log_lines(self.__logs[n - 1]))
 
         if jobs is None:
             return err, msg, None
 
         def _color_me(job_status):
             if job_status == "finished":
-                return f"\33[32m{job_status}\33[0m"
+                return f"{GREEN}{job_status}{RESET}"
             elif job_status == "failed":
-                return f"\33[31m{job_status}\33[0m"
+                return f"{RED}{job_status}{RESET}"
             else:
-                return f"\33[33m{job_status}\33[0m"
+                return f"{YELLOW}{job_status}{RESET}"
 
         print(
             tabulate.tabulate(
                 [
                     [
                         jobid,
-                        job["timestamp"],
-                        job["rule"],
-                        job.get("external_jobid", "-"),
-                        _color_me(job['status'])
+                        jobs.timestamps[row],
+                        jobs.rules[row],
+                        jobs.external_jobids[row] or "-",
+                        _color_me(jobs.statuses[row])
                     ]
-                    for jobid, job in jobs.items()
+                    for jobid, row in jobs.index.items()
                 ],
                 headers=["jobid", "timestamp", "rule", "cluster_jobid", "status"],
             )
@@ -439,7 +579,8 @@ class SnakeObject(object):
 
     def jobdetails(self, jobid: int, n: int = 1):
         "Print detailed job information for jobid in n-th most recent execution"
-        err, msg, jobs = self.__parse_jobs_in_log(self.__logs[n - 1])
+        log = self.__logs[n - 1]
+        err, msg, jobs = self.__parse_jobs_in_log(read_log_lines(log), details=True)
 
         if jobs is None:
             return err, msg, None
@@ -447,8 +588,8 @@ class SnakeObject(object):
         if jobid not in jobs:
             return SnakemakeStatus.ERROR, f"Job {jobid} not found", None
 
-        job = jobs[jobid]
-        print(f"Job {jobid} details from logfile: {self.__logs[n-1]}\n----------------")
+        job = jobs.details[jobs.index[jobid]]
+        print(f"Job {jobid} details from logfile: {log}\n----------------")
         for k, v in job.items():
             print(f"{k:<15}: {v}")
 
@@ -1,5 +1,187 @@
+from datetime import datetime
+
+import pytest
+
+import snakelog.cli
 from snakelog import __version__
+from snakelog.cli import (
+    JobStats,
+    SnakeObject,
+    parse_log_name,
+    parse_log_tail,
+    parse_rule_grammar,
+    read_log_lines,
+)
+
+WORKFLOW_ERROR_LOG = """Building DAG of jobs...
+WorkflowError in file /x/Snakefile, line 3:
+--------------------
+This is a longer message line
+"""
+
+
+def make_workflow(tmp_path, logs):
+    "Create a .snakemake/log directory with the given {name: text} logs"
+    log_dir = tmp_path / ".snakemake" / "log"
+    log_dir.mkdir(parents=True)
+    for name, text in logs.items():
+        (log_dir / name).write_text(text)
+    return SnakeObject(tmp_path)
+
+
+def read_log_lines_from(tmp_path, text):
+    "Write text to a scratch log and read it back as log lines"
+    log = tmp_path / "scratch.log"
+    log.write_text(text)
+    return read_log_lines(log)
 
 
 def test_version():
     assert __version__ == '0.1.0'
+
+
+def test_parse_log_tail(tmp_path):
+    log = tmp_path / "2023-08-23T181823.838448.snakemake.log"
+    log.write_text("Finished job 0.\n2 of 2 steps (100%) done\nComplete log: x.log\n")
+    assert parse_log_tail(log) == 2
+
+    log.write_text("Finished job 0.\n999 of 1000 steps (100%) done\n")
+    assert parse_log_tail(log) is None
+
+    log.write_text("Exiting because a job execution failed.\n")
+    assert parse_log_tail(log) is None
+
+    log.write_text("")
+    assert parse_log_tail(log) is None
+
+
+def test_parse_rule_grammar_values_with_colons():
+    assert parse_rule_grammar("params: url=http://x, n=1", {}) == {
+        "params": {"url": "http://x", "n": "1"}
+    }
+    assert parse_rule_grammar("resources: runtime=00:10:00", {}) == {
+        "resources": {"runtime": "00:10:00"}
+    }
+    assert parse_rule_grammar("log: logs/a:b.log", {}) == {"log": "logs/a:b.log"}
+
+
+def test_parse_log_name():
+    assert parse_log_name("2023-08-23T230733.352042") == datetime(
+        2023, 8, 23, 23, 7, 33, 352042
+    )
+    # isoformat() omits microseconds when they are 0
+    assert parse_log_name("2023-08-24T101010") == datetime(2023, 8, 24, 10, 10, 10)
+
+
+def test_log_cache_uuid(tmp_path):
+    log_dir = tmp_path / ".snakemake" / "log"
+    log_dir.mkdir(parents=True)
+    (log_dir / "2023-08-23T230733.352042.snakemake.log").touch()
+    (log_dir / "2023-08-24T101010.snakemake.log").touch()
+
+    uuids = [uuid for _, _, uuid in SnakeObject(tmp_path)._log_cache]
+    assert uuids == ["", "352042"]
+
+
+def test_read_log_lines(tmp_path):
+    log = tmp_path / "2023-08-23T181823.838448.snakemake.log"
+    log.write_bytes(b"[Wed Aug 23 18:18:24 2023]\r\nrule a:\r\na\x0cb\n")
+    assert read_log_lines(log) == ["[Wed Aug 23 18:18:24 2023]\n", "rule a:\n", "a\x0cb\n"]
+
+
+def test_history_error_log(tmp_path, capsys):
+    workflow = make_workflow(
+        tmp_path, {"2023-08-25T101010.123456.snakemake.log": WORKFLOW_ERROR_LOG}
+    )
+    workflow.history()
+    assert "Snakemake exited with an error" in capsys.readouterr().out
+
+
+def test_stats(tmp_path):
+    workflow = make_workflow(tmp_path, {})
+    lines = read_log_lines_from(
+        tmp_path,
+        "Job stats:\n"
+        "job      count    min threads    max threads\n"
+        "-----  -------  -------------  -------------\n"
+        "a            2              1              1\n"
+        "total        2              1              1\n"
+        "\n"
+        "Select jobs to execute...\n",
+    )
+    assert workflow._stats(lines) == {
+        "a": JobStats("a", 2, 1, 1),
+        "total": JobStats("total", 2, 1, 1),
+    }
+
+    error = "WorkflowError in file /x/Snakefile:\n--------------------\nSome message here\n"
+    assert workflow._stats(read_log_lines_from(tmp_path, error)) == {}
+
+
+def test_status_error_log(tmp_path, capsys):
+    workflow = make_workflow(
+        tmp_path, {"2023-08-25T101010.123456.snakemake.log": WORKFLOW_ERROR_LOG}
+    )
+    with pytest.raises(SystemExit):
+        workflow.status()
+    assert "Snakemake exited with an error. No jobs to display" in capsys.readouterr().out
+
+
+COMPLETE_LOG = """Building DAG of jobs...
+Job stats:
+job      count
+-----  -------
+a            2
+all          1
+total        3
+
+Select jobs to execute...
+
+[Wed Aug 23 18:18:24 2023]
+rule a:
+    output: a1.txt
+    jobid: 1
+    wildcards: x=1
+    resources: tmpdir=/tmp
+
+Submitted job 1 with external jobid 'Submitted batch job 101'.
+
+[Wed Aug 23 18:18:24 2023]
+rule a:
+    output: a2.txt
+    jobid: 2
+    wildcards: x=2
+    resources: tmpdir=/tmp
+
+Submitted job 2 with external jobid 'Submitted batch job 102'.
+[Wed Aug 23 18:18:30 2023]
+Finished job 1.
+1 of 3 steps (33%) done
+[Wed Aug 23 18:18:31 2023]
+Finished job 2.
+2 of 3 steps (67%) done
+Select jobs to execute...
+
+[Wed Aug 23 18:18:31 2023]
+localrule all:
+    input: a1.txt, a2.txt
+    jobid: 0
+    resources: tmpdir=/tmp
+
+[Wed Aug 23 18:18:31 2023]
+Finished job 0.
+3 of 3 steps (100%) done
+Complete log: .snakemake/log/2023-08-23T181823.838448.snakemake.log
+"""
+
+
+def test_execution_totals_tail_matches_full_parse(tmp_path, monkeypatch):
+    name = "2023-08-23T181823.838448.snakemake.log"
+    workflow = make_workflow(tmp_path, {name: COMPLETE_LOG})
+    log = tmp_path / ".snakemake" / "log" / name
+
+    fast = workflow._execution_totals(log)
+    monkeypatch.setattr(snakelog.cli, "parse_log_tail", lambda log: None)
+    full = workflow._execution_totals(log)
+
+    assert fast == full == ("", (3, 0, 0, 3))